@@ -2,75 +2,317 @@
 """
 IMDb Top 250 Movies Scraper (Pure Web Scraping)
 
-This script scrapes the IMDb Top 250 movies list using requests and BeautifulSoup only.
+This script scrapes the IMDb Top 250 movies list using requests and selectolax only.
 Uses multiple HTTP requests to get all 250 movies from IMDb's various endpoints.
 
 Requirements:
 - requests
-- beautifulsoup4
-- pandas
+- requests-cache
+- aiohttp
+- aiohttp-client-cache
+- aiosqlite
+- selectolax
+- orjson
+- brotli
+- tenacity
+- uvloop (optional, not available on Windows)
 
-Install with: pip install requests beautifulsoup4 pandas
+Install with: pip install -r requirements.txt
 """
 
+import asyncio
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import time
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from selectolax.lexbor import LexborHTMLParser
 import re
 from urllib.parse import urljoin, parse_qs, urlparse
 import logging
 import json
+import csv
+import heapq
+from dataclasses import dataclass, asdict
+import contextlib
+import argparse
+import sys
+
+# orjson parses the JSON-LD blocks; fall back to the stdlib where it has no wheel
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# uvloop is an optional, faster event loop; it is not available on Windows
+try:
+    import uvloop
+    _run = uvloop.run
+except ImportError:
+    _run = asyncio.run
+
+# urllib3 and aiohttp only decode brotli bodies when the brotli package is
+# installed, so advertise br to IMDb only in that case
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+MOVIE_COLUMNS = ['rank', 'title', 'year', 'rating', 'url']
+
+@dataclass(slots=True)
+class Movie:
+    """One scraped chart entry; fields follow MOVIE_COLUMNS"""
+    rank: int | None = None
+    title: str = "Unknown"
+    year: int | None = None
+    rating: float | None = None
+    url: str | None = None
+
+def _rank_key(movie):
+    """Sort key placing movies without a rank last"""
+    return movie.rank if movie.rank is not None else 999
+
+# Cached IMDb responses are reused for a day; the chart changes at most daily
+CACHE_EXPIRE_SECONDS = 86400
+
+# Chart pages parsing to fewer movies than this are treated as partially
+# loaded and are not kept in the page cache
+MIN_CACHED_MOVIES = 200
+
+# Rate limiting and server errors are worth retrying; other statuses are final
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+DEFAULT_DETAILS = {'director': 'Unknown', 'runtime_minutes': None, 'genres': 'Unknown'}
+
+MOBILE_USER_AGENT = 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15'
+
+# Precompiled patterns used while extracting movie data
+_RE_RANK_NUM = re.compile(r'(\d+)')
+_RE_YEAR4 = re.compile(r'(\d{4})')
+_RE_YEAR_PAREN = re.compile(r'\((\d{4})\)')
+_RE_RANK_PREFIX = re.compile(r'^(\d+)\.')
+_RE_TITLE_RANK = re.compile(r'^\d+\.\s*(.*)')
+_RE_RANK_STRIP = re.compile(r'^\d+\.\s*')
+_RE_TITLE_HREF = re.compile(r'/title/(tt\d+)/')
+_RE_RUNTIME_HOURS = re.compile(r'(\d+)\s*h')
+_RE_RUNTIME_MINUTES = re.compile(r'(\d+)\s*m')
+
+# Embedded JSON patterns
+_RE_ANY_TITLE = re.compile(r'"(?:titleText|primaryText|title)"\s*:\s*"([^"]+)"')
+_RE_RELEASE_YEAR = re.compile(r'"releaseYear"\s*:\s*(\d{4})')
+_RE_RATING_VALUE = re.compile(r'"ratingValue"\s*:\s*(\d+\.?\d*)')
+
+# CSS selectors. The generic extractor's selectors are combined to match
+# in one engine pass.
+_SEL_TITLE = 'h3.ipc-title__text, a.titleColumn, td.titleColumn a, a[href*="/title/tt"], .cli-title a'
+_SEL_YEAR = '.cli-title-metadata-item, .secondaryInfo'
+_SEL_RATING = '.ipc-rating-star--rating, strong, .ratingColumn strong, .cli-rating'
+_SEL_TITLE_LINK = 'a[href*="/title/tt"]'
+
+# Every candidate shape extract_from_classic_page understands, in one query
+_SEL_CANDIDATES = 'tbody.lister-list tr, li.ipc-metadata-list-summary-item, tr:has(a[href*="/title/tt"])'
+
+# Movie element selectors for parse_html_for_movies, tried in order
+_SEL_MOVIE_ELEMENTS = [
+    'li.ipc-metadata-list-summary-item',
+    'tr[data-testid]',
+    'li.titleColumn',
+    '.lister-item',
+    '.cli-item'
+]
+
+def _parse_html(content, encoding=None):
+    """Build a Lexbor tree, decoding bytes with the response charset when known"""
+    if isinstance(content, bytes):
+        try:
+            content = content.decode(encoding or 'utf-8', errors='replace')
+        except LookupError:
+            content = content.decode('utf-8', errors='replace')
+    return LexborHTMLParser(content)
+
+def _classes(node):
+    """The CSS classes set on a node"""
+    return (node.attributes.get('class') or '').split()
+
+def _has_ancestor(node, tag, cls):
+    """Whether any ancestor of node is a <tag> element with class cls"""
+    parent = node.parent
+    while parent is not None:
+        if parent.tag == tag and cls in _classes(parent):
+            return True
+        parent = parent.parent
+    return False
+
+def _index_by_class(elements):
+    """Map each CSS class to the first element that carries it"""
+    index = {}
+    for elem in elements:
+        for cls in _classes(elem):
+            index.setdefault(cls, elem)
+    return index
+
 class IMDbTop250Scraper:
     def __init__(self):
         self.base_url = "https://www.imdb.com"
-        self.session = requests.Session()
+        # Responses are cached on disk so re-runs skip pages fetched recently
+        self.session = requests_cache.CachedSession(
+            'imdb_cache',
+            expire_after=CACHE_EXPIRE_SECONDS,
+            allowable_codes=(200,)
+        )
+        self._clear_page_cache = False
         
         # Headers to mimic a real browser
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
             'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0'
+            'Sec-Fetch-Site': 'none'
         }
         self.session.headers.update(self.headers)
         
+        # Pool connections to IMDb and let urllib3 retry transient failures.
+        # Other 4xx responses are returned straight away since retrying
+        # them cannot succeed; 429 honours the server's Retry-After header.
+        retry_policy = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry_policy)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Store cookies from the main page
         self._initialize_session()
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close pooled connections held by the requests session"""
+        self.session.close()
+    
+    def clear_cache(self):
+        """Drop cached responses so the next scrape fetches every page fresh"""
+        self.session.cache.clear()
+        # The aiohttp page cache can only be cleared from inside the event loop
+        self._clear_page_cache = True
+    
     def _initialize_session(self):
         """Initialize session by visiting main IMDb page to get cookies"""
         try:
-            response = self.session.get("https://www.imdb.com", timeout=10)
+            # Cookies only come from a live response, never from the cache
+            with self.session.cache_disabled():
+                response = self.session.get("https://www.imdb.com", timeout=10)
             logger.info("Session initialized with IMDb cookies")
         except Exception as e:
             logger.warning(f"Failed to initialize session: {e}")
     
-    def get_page_with_retries(self, url, retries=3):
-        """Get page content with retry logic"""
-        for attempt in range(retries):
-            try:
-                response = self.session.get(url, timeout=15)
-                response.raise_for_status()
-                return response
-            except requests.RequestException as e:
-                logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
-                if attempt < retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-        return None
-    
-    def try_classic_imdb_page(self):
+    def get_page_with_retries(self, url):
+        """Get page content, retries are handled by the mounted adapter"""
+        try:
+            response = self.session.get(url, timeout=15)
+            response.raise_for_status()
+            return response
+        except requests.HTTPError as e:
+            logger.warning(f"Request to {url} returned status {e.response.status_code}")
+            return None
+        except requests.RequestException as e:
+            logger.warning(f"Request failed for {url}: {e}")
+            return None
+    
+    @contextlib.asynccontextmanager
+    async def _client_session(self, max_in_flight):
+        """Open a cached aiohttp session with the requests session's headers and cookies, plus a semaphore capping its requests in flight"""
+        async with CachedSession(
+            cache=SQLiteBackend('imdb_page_cache', expire_after=CACHE_EXPIRE_SECONDS, allowed_codes=(200,)),
+            headers=self.headers,
+            cookies=self.session.cookies.get_dict(),
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=15)
+        ) as session:
+            if self._clear_page_cache:
+                await session.cache.clear()
+                self._clear_page_cache = False
+            # Created per session, so concurrent scrapes never share a limit
+            yield session, asyncio.Semaphore(max_in_flight)
+    
+    async def _fetch(self, session, semaphore, url, headers=None, params=None):
+        """Fetch a page with aiohttp as (body bytes, header charset), None on failure"""
+        try:
+            return await self._get_with_retries(session, semaphore, url, headers, params)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Request failed for {url}: {e}")
+            return None
+    
+    # Transient failures back off exponentially with jitter, so concurrent
+    # requests that fail together don't retry in lockstep
+    @retry(
+        stop=stop_after_attempt(4),
+        wait=wait_exponential_jitter(initial=1, max=10),
+        retry=retry_if_exception_type((aiohttp.ClientConnectionError, aiohttp.ClientResponseError, asyncio.TimeoutError)),
+        reraise=True
+    )
+    async def _get_with_retries(self, session, semaphore, url, headers, params):
+        """One GET attempt; raises on errors worth retrying"""
+        # The slot is only held for the request itself, not the backoff sleep
+        async with semaphore:
+            async with session.get(url, headers=headers, params=params) as response:
+                if response.status in RETRY_STATUSES:
+                    response.raise_for_status()
+                if response.status != 200:
+                    logger.warning(f"Request to {url} returned status {response.status}")
+                    return None
+                logger.debug(f"{url} served with Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}")
+                # Raw bytes plus the declared charset; response.text() would
+                # run charset detection over the whole body when none is declared
+                return await response.read(), response.charset
+    
+    async def _fetch_and_parse(self, session, semaphore, parse, url, headers=None, params=None):
+        """Fetch a page and run its parser in a worker thread, None if the fetch failed"""
+        page = await self._fetch(session, semaphore, url, headers=headers, params=params)
+        if page is None:
+            return None
+        
+        # Parsing is CPU-bound, keep it off the event loop so other fetches progress
+        content, encoding = page
+        result = await asyncio.to_thread(parse, content, encoding)
+        
+        # Drop short chart pages from the cache so a re-run fetches them again
+        # instead of replaying the same partial result
+        if isinstance(result, list) and len(result) < MIN_CACHED_MOVIES:
+            await session.cache.delete_url(url, params=params)
+        return result
+    
+    def _parse_classic(self, content, encoding=None):
+        """Parse a chart page with the classic page extractors"""
+        return self.extract_from_classic_page(_parse_html(content, encoding))
+    
+    def _parse_any_page(self, content, encoding=None):
+        """Parse a page with every known extraction method"""
+        return self.extract_movies_from_any_page(_parse_html(content, encoding))
+    
+    async def try_classic_imdb_page(self, session, semaphore):
         """Try the classic IMDb interface which might show all movies"""
         try:
             # Try classic/old IMDb interface
@@ -80,19 +322,17 @@ class IMDbTop250Scraper:
                 "https://www.imdb.com/chart/top"
             ]
             
-            for url in classic_urls:
-                logger.info(f"Trying classic interface: {url}")
-                response = self.get_page_with_retries(url)
-                
-                if response:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    movies = self.extract_from_classic_page(soup)
-                    
+            logger.info(f"Trying {len(classic_urls)} classic interface URLs concurrently")
+            results = await asyncio.gather(
+                *(self._fetch_and_parse(session, semaphore, self._parse_classic, url) for url in classic_urls),
+                return_exceptions=True
+            )
+            
+            for url, movies in zip(classic_urls, results):
+                if isinstance(movies, list):
                     if len(movies) > 50:  # If we got a good number of movies
-                        logger.info(f"Classic interface successful: {len(movies)} movies")
+                        logger.info(f"Classic interface successful ({url}): {len(movies)} movies")
                         return movies
-                
-                time.sleep(1)
             
             return []
             
@@ -100,25 +340,33 @@ class IMDbTop250Scraper:
             logger.error(f"Classic page method failed: {e}")
             return []
     
-    def extract_from_classic_page(self, soup):
+    def extract_from_classic_page(self, tree):
         """Extract movies from classic IMDb page structure"""
         movies = []
         
         try:
+            # Collect all candidate rows and containers in a single tree walk.
+            # Lexbor reports a node once per selector it matches, so dedupe.
+            rows = []
+            containers = []
+            for candidate in dict.fromkeys(tree.css(_SEL_CANDIDATES)):
+                if candidate.tag == 'li':
+                    containers.append(candidate)
+                else:
+                    rows.append(candidate)
+            
             # Look for the classic table structure
-            tbody = soup.find('tbody', class_='lister-list')
-            if tbody:
-                rows = tbody.find_all('tr')
-                logger.info(f"Found {len(rows)} rows in classic table")
+            classic_rows = [row for row in rows if _has_ancestor(row, 'tbody', 'lister-list')]
+            if classic_rows:
+                logger.info(f"Found {len(classic_rows)} rows in classic table")
                 
-                for row in rows:
+                for row in classic_rows:
                     movie_data = self.extract_from_classic_row(row)
                     if movie_data:
                         movies.append(movie_data)
             
             # Alternative: Look for movie containers in modern structure
             if not movies:
-                containers = soup.find_all('li', class_='ipc-metadata-list-summary-item')
                 logger.info(f"Found {len(containers)} containers in modern structure")
                 
                 for i, container in enumerate(containers, 1):
@@ -126,16 +374,14 @@ class IMDbTop250Scraper:
                     if movie_data:
                         movies.append(movie_data)
             
-            # Alternative: Look for any table rows
+            # Alternative: Look for any table rows linking to a title
             if not movies:
-                all_rows = soup.find_all('tr')
-                logger.info(f"Found {len(all_rows)} total rows")
+                logger.info(f"Found {len(rows)} candidate table rows")
                 
-                for i, row in enumerate(all_rows):
-                    if self.is_movie_row(row):
-                        movie_data = self.extract_from_any_row(row, len(movies) + 1)
-                        if movie_data:
-                            movies.append(movie_data)
+                for row in rows:
+                    movie_data = self.extract_from_any_row(row, len(movies) + 1)
+                    if movie_data:
+                        movies.append(movie_data)
             
             return movies
             
@@ -146,65 +392,61 @@ class IMDbTop250Scraper:
     def extract_from_classic_row(self, row):
         """Extract movie data from classic table row"""
         try:
+            # Index the row's cells by class in a single pass
+            cells = _index_by_class(cell for cell in row.iter() if cell.tag == 'td')
+            
             # Rank
-            rank_cell = row.find('td', class_='ratingColumn')
+            rank_cell = cells.get('ratingColumn')
             rank = None
             if rank_cell:
-                rank_text = rank_cell.get_text(strip=True)
-                rank_match = re.search(r'(\d+)', rank_text)
+                rank_text = rank_cell.text(strip=True)
+                rank_match = _RE_RANK_NUM.search(rank_text)
                 if rank_match:
                     rank = int(rank_match.group(1))
             
             # Title and Year
-            title_cell = row.find('td', class_='titleColumn')
+            title_cell = cells.get('titleColumn')
             if not title_cell:
                 return None
             
-            title_link = title_cell.find('a')
-            title = title_link.get_text(strip=True) if title_link else "Unknown"
+            title_link = title_cell.css_first('a')
+            title = title_link.text(strip=True) if title_link else "Unknown"
             
             # Year
             year = None
-            year_span = title_cell.find('span', class_='secondaryInfo')
+            year_span = title_cell.css_first('span.secondaryInfo')
             if year_span:
-                year_text = year_span.get_text(strip=True)
-                year_match = re.search(r'(\d{4})', year_text)
+                year_text = year_span.text(strip=True)
+                year_match = _RE_YEAR4.search(year_text)
                 if year_match:
                     year = int(year_match.group(1))
             
             # Rating
             rating = None
-            rating_cell = row.find('td', class_='ratingColumn')
-            if rating_cell:
-                strong = rating_cell.find('strong')
+            if rank_cell:
+                strong = rank_cell.css_first('strong')
                 if strong:
                     try:
-                        rating = float(strong.get_text(strip=True))
+                        rating = float(strong.text(strip=True))
                     except ValueError:
                         pass
             
             # URL
             movie_url = None
-            if title_link and title_link.get('href'):
-                movie_url = urljoin(self.base_url, title_link['href'])
+            if title_link and title_link.attributes.get('href'):
+                movie_url = urljoin(self.base_url, title_link.attributes['href'])
             
             # If no rank found, try to extract from the row position
             if not rank:
                 # Look for numbering in the title or nearby elements
-                numbering = row.find('td', class_='numberColumn')
+                numbering = cells.get('numberColumn')
                 if numbering:
-                    rank_text = numbering.get_text(strip=True)
-                    rank_match = re.search(r'(\d+)', rank_text)
+                    rank_text = numbering.text(strip=True)
+                    rank_match = _RE_RANK_NUM.search(rank_text)
                     if rank_match:
                         rank = int(rank_match.group(1))
             
-            return {
-                'rank': rank,
-                'title': title,
-                'year': year,
-                'rating': rating,
-                'url': movie_url
-            }
+            return Movie(rank=rank, title=title, year=year, rating=rating, url=movie_url)
             
         except Exception as e:
             logger.error(f"Error extracting from classic row: {e}")
@@ -213,103 +455,93 @@ class IMDbTop250Scraper:
     def extract_from_container(self, container, rank):
         """Extract movie data from modern container structure"""
         try:
+            # Index the container's elements by class in a single pass
+            elements = _index_by_class(container.css('h3, span, a'))
+            
             # Title
-            title_elem = container.find('h3', class_='ipc-title__text')
+            title_elem = elements.get('ipc-title__text')
             title = "Unknown"
             if title_elem:
-                title_text = title_elem.get_text(strip=True)
+                title_text = title_elem.text(strip=True)
                 # Remove rank number if present (e.g., "1. Movie Title" -> "Movie Title")
-                title_match = re.match(r'^\d+\.\s*(.*)', title_text)
+                title_match = _RE_TITLE_RANK.match(title_text)
                 title = title_match.group(1) if title_match else title_text
             
             # Year
             year = None
-            year_elem = container.find('span', class_='cli-title-metadata-item')
+            year_elem = elements.get('cli-title-metadata-item')
             if year_elem:
-                year_text = year_elem.get_text(strip=True)
-                year_match = re.search(r'(\d{4})', year_text)
+                year_text = year_elem.text(strip=True)
+                year_match = _RE_YEAR4.search(year_text)
                 if year_match:
                     year = int(year_match.group(1))
             
             # Rating
             rating = None
-            rating_elem = container.find('span', class_='ipc-rating-star--rating')
+            rating_elem = elements.get('ipc-rating-star--rating')
             if rating_elem:
                 try:
-                    rating = float(rating_elem.get_text(strip=True))
+                    rating = float(rating_elem.text(strip=True))
                 except ValueError:
                     pass
             
             # URL
             movie_url = None
-            link_elem = container.find('a', class_='ipc-title-link-wrapper')
-            if link_elem and link_elem.get('href'):
-                movie_url = urljoin(self.base_url, link_elem['href'])
-            
-            return {
-                'rank': rank,
-                'title': title,
-                'year': year,
-                'rating': rating,
-                'url': movie_url
-            }
+            link_elem = elements.get('ipc-title-link-wrapper')
+            if link_elem and link_elem.attributes.get('href'):
+                movie_url = urljoin(self.base_url, link_elem.attributes['href'])
+            
+            return Movie(rank=rank, title=title, year=year, rating=rating, url=movie_url)
             
         except Exception as e:
             logger.error(f"Error extracting from container: {e}")
             return None
     
-    def is_movie_row(self, row):
-        """Check if a table row contains movie data"""
-        # Look for indicators that this is a movie row
-        has_title_link = row.find('a', href=re.compile(r'/title/tt\d+/'))
-        has_rating = row.find('strong') or row.find('span', class_='ipc-rating-star--rating')
-        has_year = bool(re.search(r'\(\d{4}\)', row.get_text()))
-        
-        return bool(has_title_link and (has_rating or has_year))
-    
     def extract_from_any_row(self, row, rank):
         """Extract movie data from any table row that contains movie info"""
         try:
             # Find title link
-            title_link = row.find('a', href=re.compile(r'/title/tt\d+/'))
+            title_link = next(
+                (link for link in row.css(_SEL_TITLE_LINK) if _RE_TITLE_HREF.search(link.attributes.get('href') or '')),
+                None
+            )
             if not title_link:
                 return None
             
-            title = title_link.get_text(strip=True)
+            title = title_link.text(strip=True)
             
-            # Extract year
+            # Extract year from the first text node holding "(YYYY)"; the
+            # newline separator keeps matches from spanning text nodes
             year = None
-            row_text = row.get_text()
-            year_match = re.search(r'\((\d{4})\)', row_text)
+            year_match = _RE_YEAR_PAREN.search(row.text(separator='\n'))
             if year_match:
                 year = int(year_match.group(1))
             
             # Extract rating
             rating = None
-            rating_elem = row.find('strong') or row.find('span', class_='ipc-rating-star--rating')
+            rating_elem = row.css_first('strong') or row.css_first('span.ipc-rating-star--rating')
+            
+            # Rows with neither a year nor a rating are not movie rows
+            if year is None and rating_elem is None:
+                return None
+            
             if rating_elem:
-                rating_text = rating_elem.get_text(strip=True)
+                rating_text = rating_elem.text(strip=True)
                 try:
                     rating = float(rating_text)
                 except ValueError:
                     pass
             
             # URL
-            movie_url = urljoin(self.base_url, title_link['href']) if title_link.get('href') else None
-            
-            return {
-                'rank': rank,
-                'title': title,
-                'year': year,
-                'rating': rating,
-                'url': movie_url
-            }
+            movie_url = urljoin(self.base_url, title_link.attributes['href'])
+            
+            return Movie(rank=rank, title=title, year=year, rating=rating, url=movie_url)
             
         except Exception as e:
             logger.error(f"Error extracting from any row: {e}")
             return None
     
-    def try_paginated_requests(self):
+    async def try_paginated_requests(self, session, semaphore):
         """Try to get movies through paginated requests"""
         movies = []
         
@@ -321,19 +553,20 @@ class IMDbTop250Scraper:
                 {'offset': 0, 'limit': 250}
             ]
             
-            for params in base_params:
-                url = "https://www.imdb.com/chart/top/"
-                response = self.session.get(url, params=params, timeout=15)
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    page_movies = self.extract_from_classic_page(soup)
-                    
+            url = "https://www.imdb.com/chart/top/"
+            results = await asyncio.gather(
+                *(self._fetch_and_parse(session, semaphore, self._parse_classic, url, params=params) for params in base_params),
+                return_exceptions=True
+            )
+            
+            for page_movies in results:
+                if isinstance(page_movies, list):
                     if len(page_movies) > len(movies):
                         movies = page_movies
                         logger.info(f"Paginated request successful: {len(movies)} movies")
-                
-                time.sleep(1)
+                    
+                    if len(movies) >= 250:
+                        return movies
             
             return movies
             
@@ -341,7 +574,7 @@ class IMDbTop250Scraper:
             logger.error(f"Paginated requests failed: {e}")
             return []
     
-    def try_mobile_and_alternative_endpoints(self):
+    async def try_mobile_and_alternative_endpoints(self, session, semaphore):
         """Try mobile version and other alternative endpoints"""
         movies = []
         
@@ -354,28 +587,27 @@ class IMDbTop250Scraper:
                 "https://www.imdb.com/search/title/?groups=top_250&sort=user_rating,desc"
             ]
             
-            for url in endpoints:
-                logger.info(f"Trying endpoint: {url}")
-                
-                # Use mobile headers for mobile URLs
-                if 'm.imdb.com' in url:
-                    mobile_headers = self.headers.copy()
-                    mobile_headers['User-Agent'] = 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15'
-                    response = self.session.get(url, headers=mobile_headers, timeout=15)
-                else:
-                    response = self.get_page_with_retries(url)
-                
-                if response and response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Try to extract movies from this page
-                    endpoint_movies = self.extract_movies_from_any_page(soup)
-                    
+            # Use mobile headers for mobile URLs
+            requests_to_make = [
+                (url, {'User-Agent': MOBILE_USER_AGENT} if 'm.imdb.com' in url else None)
+                for url in endpoints
+            ]
+            
+            logger.info(f"Trying {len(endpoints)} alternative endpoints concurrently")
+            results = await asyncio.gather(
+                *(self._fetch_and_parse(session, semaphore, self._parse_any_page, url, headers=headers)
+                  for url, headers in requests_to_make),
+                return_exceptions=True
+            )
+            
+            for url, endpoint_movies in zip(endpoints, results):
+                if isinstance(endpoint_movies, list):
                     if len(endpoint_movies) > len(movies):
                         movies = endpoint_movies
                         logger.info(f"Endpoint {url} successful: {len(movies)} movies")
-                
-                time.sleep(2)  # Be respectful between requests
+                    
+                    if len(movies) >= 250:
+                        return movies
             
             return movies
             
@@ -383,54 +615,64 @@ class IMDbTop250Scraper:
             logger.error(f"Alternative endpoints failed: {e}")
             return []
     
-    def extract_movies_from_any_page(self, soup):
+    def extract_movies_from_any_page(self, tree):
         """Extract movies from any IMDb page structure"""
         movies = []
         
         try:
             # Method 1: Look for JSON-LD structured data
-            json_scripts = soup.find_all('script', type='application/ld+json')
+            json_scripts = tree.css('script[type="application/ld+json"]')
             for script in json_scripts:
+                script_content = script.text()
+                if not script_content:
+                    continue
+                
                 try:
-                    data = json.loads(script.string)
+                    data = _json_loads(script_content)
                     if isinstance(data, dict) and 'itemListElement' in data:
-                        for item in data['itemListElement']:
-                            if 'item' in item:
-                                movie_info = item['item']
-                                movie_data = {
-                                    'rank': item.get('position', len(movies) + 1),
-                                    'title': movie_info.get('name', 'Unknown'),
-                                    'year': None,
-                                    'rating': movie_info.get('aggregateRating', {}).get('ratingValue'),
-                                    'url': movie_info.get('url')
-                                }
-                                
-                                # Extract year from date
-                                if 'datePublished' in movie_info:
-                                    year_match = re.search(r'(\d{4})', movie_info['datePublished'])
-                                    if year_match:
-                                        movie_data['year'] = int(year_match.group(1))
-                                
-                                movies.append(movie_data)
-                                
+                        # IMDb formats datePublished as YYYY-MM-DD, so the
+                        # year is a plain slice rather than a regex search
+                        first_rank = len(movies)
+                        movies.extend(
+                            Movie(
+                                rank=item.get('position', first_rank + i),
+                                title=(movie_info := item['item']).get('name', 'Unknown'),
+                                year=int(published[:4]) if (published := movie_info.get('datePublished') or '')[:4].isdigit() else None,
+                                rating=(movie_info.get('aggregateRating') or {}).get('ratingValue'),
+                                url=movie_info.get('url')
+                            )
+                            for i, item in enumerate((item for item in data['itemListElement'] if 'item' in item), 1)
+                        )
+                    
                     if len(movies) >= 100:
-                        logger.info(f"JSON-LD extraction successful: {len(movies)} movies")
-                        return movies
+                        break
                         
                 except json.JSONDecodeError:
                     continue
             
+            # JSON-LD is the most complete source, skip the script and HTML scans
+            if len(movies) >= 100:
+                logger.info(f"JSON-LD extraction successful: {len(movies)} movies")
+                return movies
+            
             # Method 2: Look for embedded JSON in script tags
-            script_tags = soup.find_all('script')
+            script_tags = tree.css('script')
             for script in script_tags:
-                if script.string and ('titleText' in script.string or 'movies' in script.string.lower()):
-                    json_movies = self.extract_from_embedded_json(script.string)
-                    if len(json_movies) > len(movies):
-                        movies = json_movies
+                script_content = script.text()
+                # Cheap substring check before running any regex over the blob
+                if not script_content or (
+                    'titleText' not in script_content and 'primaryText' not in script_content
+                    and 'movies' not in script_content and 'Movies' not in script_content
+                ):
+                    continue
+                
+                json_movies = self.extract_from_embedded_json(script_content)
+                if len(json_movies) > len(movies):
+                    movies = json_movies
             
             # Method 3: Parse HTML structure
             if len(movies) < 100:
-                html_movies = self.parse_html_for_movies(soup)
+                html_movies = self.parse_html_for_movies(tree)
                 if len(html_movies) > len(movies):
                     movies = html_movies
             
@@ -445,36 +687,22 @@ class IMDbTop250Scraper:
         movies = []
         
         try:
-            # Look for common JSON patterns that contain movie data
-            patterns = [
-                r'"titleText"\s*:\s*"([^"]+)"',
-                r'"primaryText"\s*:\s*"([^"]+)"',
-                r'"title"\s*:\s*"([^"]+)"'
-            ]
+            # Look for common JSON title keys in a single scan
+            titles = _RE_ANY_TITLE.findall(script_content)
+            if len(titles) <= 50:  # Too few titles, this is probably not our data
+                return movies
             
-            for pattern in patterns:
-                titles = re.findall(pattern, script_content)
-                if len(titles) > 50:  # If we found many titles, this might be our data
-                    logger.info(f"Found {len(titles)} titles in embedded JSON")
-                    
-                    # Also look for years and ratings
-                    years = re.findall(r'"releaseYear"\s*:\s*(\d{4})', script_content)
-                    ratings = re.findall(r'"ratingValue"\s*:\s*(\d+\.?\d*)', script_content)
-                    
-                    for i, title in enumerate(titles[:250]):
-                        year = int(years[i]) if i < len(years) else None
-                        rating = float(ratings[i]) if i < len(ratings) else None
-                        
-                        movies.append({
-                            'rank': i + 1,
-                            'title': title,
-                            'year': year,
-                            'rating': rating,
-                            'url': None
-                        })
-                    
-                    if movies:
-                        return movies
+            logger.info(f"Found {len(titles)} titles in embedded JSON")
+            
+            # Also look for years and ratings
+            years = _RE_RELEASE_YEAR.findall(script_content)
+            ratings = _RE_RATING_VALUE.findall(script_content)
+            
+            for i, title in enumerate(titles[:250]):
+                year = int(years[i]) if i < len(years) else None
+                rating = float(ratings[i]) if i < len(ratings) else None
+                
+                movies.append(Movie(rank=i + 1, title=title, year=year, rating=rating))
             
             return movies
             
@@ -482,28 +710,20 @@ class IMDbTop250Scraper:
             logger.error(f"Error extracting from embedded JSON: {e}")
             return []
     
-    def parse_html_for_movies(self, soup):
+    def parse_html_for_movies(self, tree):
         """Parse HTML structure looking for movie data"""
         movies = []
         
         try:
             # Try multiple selectors to find movie elements
-            selectors = [
-                'li.ipc-metadata-list-summary-item',
-                'tr[data-testid]',
-                'li.titleColumn',
-                '.lister-item',
-                '.cli-item'
-            ]
-            
-            for selector in selectors:
-                elements = soup.select(selector)
+            for selector in _SEL_MOVIE_ELEMENTS:
+                elements = tree.css(selector)
                 if elements:
                     logger.info(f"Found {len(elements)} elements with selector: {selector}")
                     
                     for i, element in enumerate(elements, 1):
                         movie_data = self.extract_movie_data_generic(element, i)
-                        if movie_data and movie_data['title'] != "Unknown":
+                        if movie_data and movie_data.title != "Unknown":
                             movies.append(movie_data)
                     
                     if len(movies) > 50:  # If we got a good number, use this selector
@@ -518,188 +738,197 @@ class IMDbTop250Scraper:
     def extract_movie_data_generic(self, element, rank):
         """Generic movie data extraction that works with multiple HTML structures"""
         try:
-            # Title - try multiple approaches
+            # Title - first usable match across all known structures
             title = "Unknown"
-            title_selectors = [
-                'h3.ipc-title__text',
-                'a.titleColumn',
-                'td.titleColumn a',
-                'a[href*="/title/tt"]',
-                '.cli-title a'
-            ]
-            
-            for selector in title_selectors:
-                title_elem = element.select_one(selector)
-                if title_elem:
-                    title_text = title_elem.get_text(strip=True)
-                    # Clean up title
-                    title_clean = re.sub(r'^\d+\.\s*', '', title_text)  # Remove rank prefix
-                    if title_clean and len(title_clean) > 1:
-                        title = title_clean
-                        break
+            title_text = ""
+            for title_elem in element.css(_SEL_TITLE):
+                title_text = title_elem.text(strip=True)
+                # Clean up title
+                title_clean = _RE_RANK_STRIP.sub('', title_text)  # Remove rank prefix
+                if title_clean and len(title_clean) > 1:
+                    title = title_clean
+                    break
             
-            # Year - try multiple approaches
+            # Year - first match containing a four digit year
             year = None
-            year_selectors = [
-                '.cli-title-metadata-item',
-                '.secondaryInfo',
-                'span.secondaryInfo'
-            ]
-            
-            for selector in year_selectors:
-                year_elem = element.select_one(selector)
-                if year_elem:
-                    year_text = year_elem.get_text(strip=True)
-                    year_match = re.search(r'(\d{4})', year_text)
-                    if year_match:
-                        year = int(year_match.group(1))
-                        break
+            for year_elem in element.css(_SEL_YEAR):
+                year_text = year_elem.text(strip=True)
+                year_match = _RE_YEAR4.search(year_text)
+                if year_match:
+                    year = int(year_match.group(1))
+                    break
             
-            # Rating - try multiple approaches
+            # Rating - first match that parses as a number
             rating = None
-            rating_selectors = [
-                '.ipc-rating-star--rating',
-                'strong',
-                '.ratingColumn strong',
-                '.cli-rating'
-            ]
-            
-            for selector in rating_selectors:
-                rating_elem = element.select_one(selector)
-                if rating_elem:
-                    rating_text = rating_elem.get_text(strip=True)
-                    try:
-                        rating = float(rating_text)
-                        break
-                    except ValueError:
-                        continue
+            for rating_elem in element.css(_SEL_RATING):
+                rating_text = rating_elem.text(strip=True)
+                try:
+                    rating = float(rating_text)
+                    break
+                except ValueError:
+                    continue
             
             # URL
             movie_url = None
-            link_elem = element.select_one('a[href*="/title/tt"]')
-            if link_elem and link_elem.get('href'):
-                movie_url = urljoin(self.base_url, link_elem['href'])
+            link_elem = element.css_first(_SEL_TITLE_LINK)
+            if link_elem and link_elem.attributes.get('href'):
+                movie_url = urljoin(self.base_url, link_elem.attributes['href'])
             
-            # Try to extract rank from the element itself
+            # Try to extract rank from the "1. Title" prefix of the title text
             extracted_rank = rank
-            rank_text = element.get_text()
-            rank_match = re.search(r'^(\d+)\.', rank_text.strip())
+            rank_match = _RE_RANK_PREFIX.match(title_text) if title_text else None
             if rank_match:
                 extracted_rank = int(rank_match.group(1))
             
-            return {
-                'rank': extracted_rank,
-                'title': title,
-                'year': year,
-                'rating': rating,
-                'url': movie_url
-            }
+            return Movie(rank=extracted_rank, title=title, year=year, rating=rating, url=movie_url)
             
         except Exception as e:
             logger.error(f"Error in generic extraction: {e}")
             return None
     
-    def scrape_top250(self):
-        """Main scraping method that tries multiple approaches"""
+    async def scrape_top250(self):
+        """Main scraping method that runs every approach concurrently"""
         logger.info("🎬 Starting comprehensive IMDb Top 250 scraping...")
         
         all_movies = []
         
-        # Method 1: Try classic IMDb interface
-        logger.info("Method 1: Trying classic IMDb interface...")
-        classic_movies = self.try_classic_imdb_page()
-        if len(classic_movies) > len(all_movies):
-            all_movies = classic_movies
-            logger.info(f"✅ Classic interface: {len(all_movies)} movies")
-        
-        # Method 2: Try paginated requests
-        if len(all_movies) < 200:
-            logger.info("Method 2: Trying paginated requests...")
-            paginated_movies = self.try_paginated_requests()
-            if len(paginated_movies) > len(all_movies):
-                all_movies = paginated_movies
-                logger.info(f"✅ Paginated requests: {len(all_movies)} movies")
-        
-        # Method 3: Try mobile and alternative endpoints
-        if len(all_movies) < 200:
-            logger.info("Method 3: Trying mobile and alternative endpoints...")
-            alt_movies = self.try_mobile_and_alternative_endpoints()
-            if len(alt_movies) > len(all_movies):
-                all_movies = alt_movies
-                logger.info(f"✅ Alternative endpoints: {len(all_movies)} movies")
-        
-        # Clean and validate the movie list
-        valid_movies = []
-        seen_titles = set()
+        # Cap in-flight requests instead of sleeping between them
+        async with self._client_session(max_in_flight=10) as (session, semaphore):
+            logger.info("Trying classic interface, paginated requests and alternative endpoints...")
+            pending = {
+                asyncio.create_task(self.try_classic_imdb_page(session, semaphore), name="Classic interface"),
+                asyncio.create_task(self.try_paginated_requests(session, semaphore), name="Paginated requests"),
+                asyncio.create_task(self.try_mobile_and_alternative_endpoints(session, semaphore), name="Alternative endpoints")
+            }
+            
+            # Keep the best result as each method finishes
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    movies = task.result()
+                    if len(movies) > len(all_movies):
+                        all_movies = movies
+                        logger.info(f"✅ {task.get_name()}: {len(all_movies)} movies")
+                
+                # The full list is already in hand, cancel the remaining methods
+                if len(all_movies) >= 250 and pending:
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    break
         
+        return self._finalize(all_movies)
+    
+    def _finalize(self, all_movies):
+        """Clean, deduplicate and re-rank the scraped movies"""
+        unique = {}
+        
+        # Drop untitled rows and duplicates. Movies are keyed by IMDb title id
+        # so spelling differences don't matter; sources without links fall
+        # back to title and year, since remakes share a title but not a year.
         for movie in all_movies:
-            if (movie and movie.get('title') and movie['title'] != "Unknown" 
-                and movie['title'] not in seen_titles):
-                seen_titles.add(movie['title'])
-                valid_movies.append(movie)
+            if movie and movie.title and movie.title != "Unknown":
+                id_match = _RE_TITLE_HREF.search(movie.url) if movie.url else None
+                key = id_match.group(1) if id_match else (movie.title, movie.year)
+                kept = unique.setdefault(key, movie)
+                if kept is not movie and kept.rating is None:
+                    kept.rating = movie.rating
+        
+        valid_movies = list(unique.values())
         
-        # Sort by rank and ensure we have sequential ranks
-        valid_movies.sort(key=lambda x: x.get('rank', 999))
+        # Sort by rank and ensure we have sequential ranks (max 250 movies)
+        valid_movies.sort(key=_rank_key)
+        valid_movies = valid_movies[:250]
         for i, movie in enumerate(valid_movies, 1):
-            movie['rank'] = i
+            movie.rank = i
         
         logger.info(f"Final movie count: {len(valid_movies)}")
         
-        return valid_movies[:250]  # Return max 250 movies
+        return valid_movies
     
     def get_additional_details(self, movie_url):
         """Get additional movie details"""
+        if not movie_url:
+            return dict(DEFAULT_DETAILS)
+        
+        # Repeat fetches of a movie page are served from the response cache
+        response = self.get_page_with_retries(movie_url)
+        if response is None:
+            return dict(DEFAULT_DETAILS)
+        
         try:
-            response = self.get_page_with_retries(movie_url)
-            if not response:
-                return {'director': 'Unknown', 'runtime_minutes': None, 'genres': 'Unknown'}
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Director
-            director = "Unknown"
-            director_selectors = [
-                'a[class*="ipc-metadata-list-item__list-content-item--link"]',
-                '.credit_summary_item a',
-                '[data-testid="title-pc-principal-credit"] a'
-            ]
-            
-            for selector in director_selectors:
-                director_elem = soup.select_one(selector)
-                if director_elem:
-                    director = director_elem.get_text(strip=True)
-                    break
-            
-            # Runtime
-            runtime = None
-            runtime_text = soup.get_text()
-            runtime_match = re.search(r'(\d+)\s*min', runtime_text)
-            if runtime_match:
-                runtime = int(runtime_match.group(1))
-            
-            # Genres
-            genres = []
-            genre_selectors = [
-                '[data-testid="genres"] a',
-                '.see-more.inline a[href*="genre"]',
-                '.subtext a[href*="genre"]'
-            ]
-            
-            for selector in genre_selectors:
-                genre_elems = soup.select(selector)
-                if genre_elems:
-                    genres = [elem.get_text(strip=True) for elem in genre_elems[:3]]
-                    break
-            
-            return {
-                'director': director,
-                'runtime_minutes': runtime,
-                'genres': ', '.join(genres) if genres else "Unknown"
-            }
-            
+            return self._parse_details(response.content)
         except Exception as e:
             logger.error(f"Error getting details for {movie_url}: {e}")
-            return {'director': 'Unknown', 'runtime_minutes': None, 'genres': 'Unknown'}
+            return dict(DEFAULT_DETAILS)
+    
+    async def gather_details(self, movie_urls):
+        """Fetch and parse details for many movie pages concurrently"""
+        # Fetch each distinct URL once
+        unique_urls = list(dict.fromkeys(url for url in movie_urls if url))
+        async with self._client_session(max_in_flight=8) as (session, semaphore):
+            results = await asyncio.gather(
+                *(self._fetch_and_parse(session, semaphore, self._parse_details, url) for url in unique_urls),
+                return_exceptions=True
+            )
+        
+        details_by_url = {}
+        for url, result in zip(unique_urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting details for {url}: {result}")
+            elif result:
+                details_by_url[url] = result
+        
+        return [dict(details_by_url.get(url, DEFAULT_DETAILS)) for url in movie_urls]
+    
+    def _parse_details(self, html, encoding=None):
+        """Parse director, runtime and genres from a movie page"""
+        tree = _parse_html(html, encoding)
+        
+        # Director
+        director = "Unknown"
+        director_selectors = [
+            'a[class*="ipc-metadata-list-item__list-content-item--link"]',
+            '.credit_summary_item a',
+            '[data-testid="title-pc-principal-credit"] a'
+        ]
+        
+        for selector in director_selectors:
+            director_elem = tree.css_first(selector)
+            if director_elem:
+                director = director_elem.text(strip=True)
+                break
+        
+        # Runtime - e.g. "2 hours 22 minutes", "2h 22m" or "142 min"
+        runtime = None
+        runtime_elem = tree.css_first('[data-testid="title-techspec_runtime"], time[datetime^="PT"]')
+        if runtime_elem:
+            runtime_text = runtime_elem.text(separator=' ', strip=True, skip_empty=True)
+            hours_match = _RE_RUNTIME_HOURS.search(runtime_text)
+            minutes_match = _RE_RUNTIME_MINUTES.search(runtime_text)
+            if hours_match or minutes_match:
+                runtime = (int(hours_match.group(1)) * 60 if hours_match else 0) + \
+                          (int(minutes_match.group(1)) if minutes_match else 0)
+        
+        # Genres
+        genres = []
+        genre_selectors = [
+            '[data-testid="genres"] a',
+            '.see-more.inline a[href*="genre"]',
+            '.subtext a[href*="genre"]'
+        ]
+        
+        for selector in genre_selectors:
+            genre_elems = tree.css(selector)
+            if genre_elems:
+                genres = [elem.text(strip=True) for elem in genre_elems[:3]]
+                break
+        
+        return {
+            'director': director,
+            'runtime_minutes': runtime,
+            'genres': ', '.join(genres) if genres else "Unknown"
+        }
     
     def save_to_csv(self, movies, filename='imdb_top250_movies.csv'):
         """Save movies to CSV"""
@@ -708,21 +937,13 @@ class IMDbTop250Scraper:
             return False
         
         try:
-            df = pd.DataFrame(movies)
-            
             # Basic columns only - no additional details
-            columns = ['rank', 'title', 'year', 'rating', 'url']
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=MOVIE_COLUMNS, extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(asdict(movie) for movie in sorted(movies, key=_rank_key))
             
-            # Keep only existing columns
-            columns = [col for col in columns if col in df.columns]
-            df = df[columns]
-            
-            # Sort by rank
-            df = df.sort_values('rank')
-            
-            # Save to CSV
-            df.to_csv(filename, index=False, encoding='utf-8')
-            logger.info(f"✅ Saved {len(df)} movies to {filename}")
+            logger.info(f"✅ Saved {len(movies)} movies to {filename}")
             return True
             
         except Exception as e:
@@ -730,89 +951,116 @@ class IMDbTop250Scraper:
             return False
     
     def display_summary(self, movies, top_n=10):
-        """Display summary of scraped movies"""
+        """Display summary of scraped movies and return the printed text"""
         if not movies:
-            print("❌ No movies found")
-            return
-        
-        print(f"\n{'='*60}")
-        print(f"📊 SCRAPING RESULTS SUMMARY")
-        print(f"{'='*60}")
-        print(f"Total movies scraped: {len(movies)}")
-        
-        if len(movies) >= 200:
-            print("✅ Successfully got most/all of the Top 250!")
-        elif len(movies) >= 100:
-            print("⚠️  Got a good portion of the Top 250 movies")
+            lines = ["❌ No movies found"]
         else:
-            print("⚠️  Limited results due to IMDb's dynamic loading")
-        
-        print(f"\n🎬 Top {min(top_n, len(movies))} Movies:")
-        print("-" * 60)
-        
-        for i, movie in enumerate(sorted(movies, key=lambda x: x.get('rank', 999))[:top_n]):
-            print(f"{movie.get('rank', i+1):3d}. {movie.get('title', 'Unknown')} ({movie.get('year', 'Unknown')}) - {movie.get('rating', 'N/A')}/10")
-        
-        # Statistics
-        df = pd.DataFrame(movies)
-        if 'rating' in df.columns and df['rating'].notna().any():
-            print(f"\n📈 Average Rating: {df['rating'].mean():.2f}")
-        if 'year' in df.columns and df['year'].notna().any():
-            print(f"📅 Year Range: {int(df['year'].min())} - {int(df['year'].max())}")
+            lines = [
+                f"\n{'='*60}",
+                f"📊 SCRAPING RESULTS SUMMARY",
+                f"{'='*60}",
+                f"Total movies scraped: {len(movies)}",
+            ]
+            
+            if len(movies) >= 200:
+                lines.append("✅ Successfully got most/all of the Top 250!")
+            elif len(movies) >= 100:
+                lines.append("⚠️  Got a good portion of the Top 250 movies")
+            else:
+                lines.append("⚠️  Limited results due to IMDb's dynamic loading")
+            
+            lines.append(f"\n🎬 Top {min(top_n, len(movies))} Movies:")
+            lines.append("-" * 60)
+            
+            top = heapq.nsmallest(top_n, movies, key=_rank_key)
+            lines.extend(
+                f"{movie.rank or i+1:3d}. {movie.title} ({movie.year or 'Unknown'}) - {movie.rating or 'N/A'}/10"
+                for i, movie in enumerate(top)
+            )
+            
+            # Statistics, gathered in a single pass over the movies
+            rating_total = 0.0
+            rating_count = 0
+            year_min = year_max = None
+            for m in movies:
+                if m.rating is not None:
+                    rating_total += m.rating
+                    rating_count += 1
+                if m.year is not None:
+                    if year_min is None or m.year < year_min:
+                        year_min = m.year
+                    if year_max is None or m.year > year_max:
+                        year_max = m.year
+            if rating_count:
+                lines.append(f"\n📈 Average Rating: {rating_total / rating_count:.2f}")
+            if year_min is not None:
+                lines.append(f"📅 Year Range: {year_min} - {year_max}")
+            
+            lines.append(f"{'='*60}")
         
-        print(f"{'='*60}")
+        # One write instead of a print (and lock/syscall) per line
+        text = "\n".join(lines) + "\n"
+        sys.stdout.write(text)
+        return text
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Scrape the IMDb Top 250 movies list to CSV")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="clear cached IMDb responses and fetch every page fresh")
+    args = parser.parse_args()
+    
     print("🎬 IMDb Top 250 Movies Scraper")
     print("=" * 50)
     print("✅ No Selenium required - Pure web scraping!")
     print("📡 Uses multiple methods to get all 250 movies")
     print()
     
-    scraper = IMDbTop250Scraper()
-    
-    # Simple filename input only
-    filename = input("📁 Enter CSV filename (default: imdb_top250_movies.csv): ").strip()
-    if not filename:
-        filename = 'imdb_top250_movies.csv'
-    
-    print(f"\n🚀 Starting scraping process...")
-    print("⏳ This may take a few minutes...")
-    
-    try:
-        # Scrape movies (no additional details to avoid errors)
-        movies = scraper.scrape_top250()
+    with IMDbTop250Scraper() as scraper:
+        if args.no_cache:
+            scraper.clear_cache()
+        
+        # Simple filename input only
+        filename = input("📁 Enter CSV filename (default: imdb_top250_movies.csv): ").strip()
+        if not filename:
+            filename = 'imdb_top250_movies.csv'
+        
+        print(f"\n🚀 Starting scraping process...")
+        print("⏳ This may take a few minutes...")
         
-        if movies:
-            # Save to CSV
-            success = scraper.save_to_csv(movies, filename)
+        try:
+            # Scrape movies (no additional details to avoid errors)
+            movies = _run(scraper.scrape_top250())
             
-            if success:
-                scraper.display_summary(movies, top_n=15)
-                print(f"\n💾 Data saved to: {filename}")
-                print(f"📊 Total movies in CSV: {len(movies)}")
-                
-                if len(movies) < 200:
-                    print("\n💡 Tips for better results:")
-                    print("   • Try running the script multiple times")
-                    print("   • IMDb's structure changes frequently")
+            if movies:
+                # Save to CSV
+                success = scraper.save_to_csv(movies, filename)
                 
+                if success:
+                    scraper.display_summary(movies, top_n=15)
+                    print(f"\n💾 Data saved to: {filename}")
+                    print(f"📊 Total movies in CSV: {len(movies)}")
+                    
+                    if len(movies) < 200:
+                        print("\n💡 Tips for better results:")
+                        print("   • Re-run with --no-cache to fetch every page fresh")
+                        print("   • IMDb's structure changes frequently")
+                    
+                else:
+                    print("❌ Failed to save data to CSV")
+                    
             else:
-                print("❌ Failed to save data to CSV")
+                print("❌ No movie data could be scraped")
+                print("🔧 This might be due to:")
+                print("   • IMDb blocking requests")
+                print("   • Changed website structure") 
+                print("   • Network connectivity issues")
                 
-        else:
-            print("❌ No movie data could be scraped")
-            print("🔧 This might be due to:")
-            print("   • IMDb blocking requests")
-            print("   • Changed website structure") 
-            print("   • Network connectivity issues")
-            
-    except KeyboardInterrupt:
-        print("\n⏹️  Scraping stopped by user")
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        print(f"❌ An unexpected error occurred: {e}")
+        except KeyboardInterrupt:
+            print("\n⏹️  Scraping stopped by user")
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            print(f"❌ An unexpected error occurred: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file